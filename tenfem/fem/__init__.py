@@ -17,6 +17,7 @@ from .assemble_local_stiffness_matrix import assemble_local_stiffness_matrix
 from .assemble_local_load_vector import assemble_local_load_vector
 from .assemble_local_convection_matrix import assemble_local_convection_matrix
 from . import indexing_utils
+from . import jit_utils
 from .scatter_to_global import (scatter_matrix_to_global,
                                 scatter_vector_to_global)
 from .solve_dirichlet import (dirichlet_form_linear_system,
@@ -15,21 +15,7 @@
 """ Assembly of the local elements of the stiffness matrix. """
 import tensorflow as tf
 import tenfem
-
-
-def _move_first_axis_to_last(arr):
-    """ Moves the first axis of a tensor to the last.
-
-    Args:
-        arr: An array like of arbitrary shape.
-
-    Returns:
-        swapped_arr: An array such that `swapped_arr[..., i] == arr[i, ...]`
-
-    """
-    arr_rank = tf.rank(arr)
-    perm = tf.concat((tf.range(1, arr_rank), tf.zeros([1], dtype=tf.int32)), axis=0)
-    return tf.transpose(arr, perm=perm)
+from tenfem.fem.jit_utils import maybe_jit_compile
 
 
 def assemble_local_convection_matrix(transport_vector_field: tf.Tensor,
@@ -54,20 +40,26 @@ def assemble_local_convection_matrix(transport_vector_field: tf.Tensor,
           elements.
 
     """
-    element_nodes = tf.gather(mesh.nodes, mesh.elements)
+    kernel = maybe_jit_compile(_assemble_local_convection_matrix, element)
+    return kernel(transport_vector_field, mesh.element_nodes)
+
 
-    wts, quad_nodes = element.get_quadrature_nodes_and_weights()
+def _assemble_local_convection_matrix(transport_vector_field, element_nodes, element):
+    """ Kernel of `assemble_local_convection_matrix` acting on the element nodes. """
+    _, quad_nodes = element.get_quadrature_nodes_and_weights()
     shape_fn, pf_shape_fn_grad, jac_det = element.isomap(element_nodes, quad_nodes)
 
-    wxarea = jac_det * wts / 2
+    wxarea = jac_det * element.half_weights
 
-    # swap shape fun grads to agree with transport_vector_field
-    pf_shape_fn_grad = _move_first_axis_to_last(pf_shape_fn_grad)
+    # inner product of the transport vector field and the shape function gradients
+    transport_dot_grad = tf.einsum('...eqd,deqi->...eqi',
+                                   transport_vector_field, pf_shape_fn_grad)
 
-    # inner product with the transport vector field and the shape function gradients
-    local_convec = tf.reduce_sum(transport_vector_field[..., tf.newaxis, :]
-                                 * pf_shape_fn_grad, axis=-1)
-    local_convec = (local_convec[..., tf.newaxis, :]
-                    * shape_fn[..., tf.newaxis])
+    # fold the quadrature weights into the test functions first, this pair
+    # carries no batch dimensions so it is the cheapest contraction
+    weighted_shape_fn = tf.einsum('eq,qj->eqj', wxarea, shape_fn)
 
-    return tf.reduce_sum(local_convec * wxarea[..., tf.newaxis, tf.newaxis], axis=-3)
+    # contract against the weighted test functions over all elements at once,
+    # this is a batched matrix product over the quadrature axis,
+    # [n_elements, element_dim, n_q] @ [..., n_elements, n_q, element_dim]
+    return tf.linalg.matmul(weighted_shape_fn, transport_dot_grad, transpose_a=True)
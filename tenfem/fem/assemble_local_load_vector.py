@@ -15,6 +15,7 @@
 """ Assemble the local load vector. """
 import tensorflow as tf
 import tenfem
+from tenfem.fem.jit_utils import maybe_jit_compile
 
 
 def assemble_local_load_vector(source: tf.Tensor,
@@ -35,13 +36,17 @@ def assemble_local_load_vector(source: tf.Tensor,
         local_load_vector: A `Tensor` of shape `[..., n_elements, element_dim]`
           giving the values of the local load vectors.
     """
-    element_nodes = tf.gather(mesh.nodes, mesh.elements)
+    kernel = maybe_jit_compile(_assemble_local_load_vector, element)
+    return kernel(source, mesh.element_nodes)
 
-    wts, quad_nodes = element.get_quadrature_nodes_and_weights()
+
+def _assemble_local_load_vector(source, element_nodes, element):
+    """ Kernel of `assemble_local_load_vector` acting on the element nodes. """
+    _, quad_nodes = element.get_quadrature_nodes_and_weights()
     shape_fn_vals, _, jac_det = element.isomap(element_nodes, quad_nodes)
 
-    wxarea = jac_det * wts / 2
-    bk_q = source[..., tf.newaxis] * shape_fn_vals
-    bk_q = tf.reduce_sum(bk_q * wxarea[..., tf.newaxis], axis=-2)
+    wxarea = jac_det * element.half_weights
+    # quadrature weighted shape functions, shape [n_elements, n_quadrature_nodes, element_dim]
+    weighted_shape_fn = tf.einsum('eq,qi->eqi', wxarea, shape_fn_vals)
 
-    return bk_q
+    return tf.einsum('...eq,eqi->...ei', source, weighted_shape_fn)
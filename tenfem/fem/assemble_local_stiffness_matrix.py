@@ -15,6 +15,7 @@
 """ Assembly of the local elements of the stiffness matrix. """
 import tensorflow as tf
 import tenfem
+from tenfem.fem.jit_utils import maybe_jit_compile
 
 
 def assemble_local_stiffness_matrix(scalar_diffusion_coefficient: tf.Tensor,
@@ -27,7 +28,8 @@ def assemble_local_stiffness_matrix(scalar_diffusion_coefficient: tf.Tensor,
     Args:
         scalar_diffusion_coefficient: A float `Tensor` of shape
           `[..., n_elements, element_dim] giving the values of the scalar
-            diffusion coefficient.
+            diffusion coefficient, or a scalar giving a constant diffusion
+            coefficient over the whole mesh.
         mesh: A `tenfem.mesh.BaseMesh` object representing the finite element
           mesh of the domain.
         element: A `tenfem.reference_element` object describing the elements of the mesh.
@@ -36,18 +38,28 @@ def assemble_local_stiffness_matrix(scalar_diffusion_coefficient: tf.Tensor,
         local_stiffness_matrix: A `Tensor` of shape `[..., n_elements, element_dim, element_dim]`
           giving the local values of the stiffness matrix tensor over elements.
     """
-    element_nodes = tf.gather(mesh.nodes, mesh.elements)
+    scalar_diffusion_coefficient = tf.convert_to_tensor(scalar_diffusion_coefficient,
+                                                        dtype=element.dtype)
+    kernel = maybe_jit_compile(_assemble_local_stiffness_matrix, element)
+    return kernel(scalar_diffusion_coefficient, mesh.element_nodes)
 
-    wts, quad_nodes = element.get_quadrature_nodes_and_weights()
+
+def _assemble_local_stiffness_matrix(scalar_diffusion_coefficient, element_nodes, element):
+    """ Kernel of `assemble_local_stiffness_matrix` acting on the element nodes. """
+    _, quad_nodes = element.get_quadrature_nodes_and_weights()
     _, pf_shape_fn_grad, jac_det = element.isomap(element_nodes, quad_nodes)
 
-    wxarea = jac_det * wts / 2
-    ak_q = tf.reduce_sum(pf_shape_fn_grad[..., tf.newaxis] * pf_shape_fn_grad[..., tf.newaxis, :], axis=0)
+    wxarea = jac_det * element.half_weights
 
-    # ak_q.shape = [n_elements, len(wts), element_dim, element_dim]
+    # quadrature weighted inner products of the pushed forward shape function
+    # gradients, formed before meeting the batched diffusion coefficient
+    # ak_q.shape = [n_elements, n_quadrature_nodes, element_dim, element_dim]
+    ak_q = tf.einsum('deqi,deqj,eq->eqij', pf_shape_fn_grad, pf_shape_fn_grad, wxarea)
 
-    # scalar diff coefficient should be shape
-    # mesh.get_quadrature_nodes()[..., 0] = [n_elements, len(wts)]
-    ak_q = ak_q * scalar_diffusion_coefficient[..., tf.newaxis, tf.newaxis]
+    if scalar_diffusion_coefficient.shape.rank == 0:
+        # a constant coefficient scales the integrated local matrices
+        return scalar_diffusion_coefficient * tf.reduce_sum(ak_q, axis=-3)
 
-    return tf.reduce_sum(ak_q * wxarea[..., tf.newaxis, tf.newaxis], axis=-3)
+    # scalar diff coefficient should be shape
+    # mesh.get_quadrature_nodes()[..., 0] = [n_elements, n_quadrature_nodes]
+    return tf.einsum('...eq,eqij->...eij', scalar_diffusion_coefficient, ak_q)
@@ -0,0 +1,77 @@
+# Copyright 2020 Daniel J. Tait
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" Utilities to optionally XLA compile the local assembly kernels. """
+import tensorflow as tf
+
+
+# `experimental_relax_shapes` was renamed to `reduce_retracing` in TF 2.9
+if tuple(int(v) for v in tf.__version__.split('.')[:2]) >= (2, 9):
+    _RELAX_SHAPES_KWARG = 'reduce_retracing'
+else:
+    _RELAX_SHAPES_KWARG = 'experimental_relax_shapes'
+
+# compiled kernels keyed by the kernel and the configuration of the element
+_compiled_kernels = {}
+
+
+def element_config(element):
+    """ Hashable description of the configuration of a reference element.
+
+    Elements with equal configurations are interchangeable for assembly,
+    whether or not they are the same instance.
+
+    Args:
+        element: A `tenfem.reference_elements.BaseReferenceElement` object.
+
+    Returns:
+        config: A hashable tuple of the type of `element` and the items of
+          `element.get_config()`.
+    """
+    return (type(element), ) + tuple(sorted(element.get_config().items()))
+
+
+def _compile_kernel(kernel, config):
+    """ XLA compiles `kernel` for elements of the configuration `config`. """
+    element_clz, config_items = config[0], dict(config[1:])
+
+    def bound_kernel(values, element_nodes):
+        # the element is rebuilt from its configuration on each trace, so the
+        # compiled kernel holds no reference to any user element
+        return kernel(values, element_nodes, element_clz(**config_items))
+
+    return tf.function(bound_kernel, jit_compile=True, **{_RELAX_SHAPES_KWARG: True})
+
+
+def maybe_jit_compile(kernel, element):
+    """ Binds `element` to a local assembly kernel, XLA compiling it if requested.
+
+    Args:
+        kernel: A python callable with signature `kernel(values, element_nodes, element)`.
+        element: A `tenfem.reference_elements.BaseReferenceElement` object.
+
+    Returns:
+        bound_kernel: A callable with signature `bound_kernel(values, element_nodes)`.
+          If `element.jit_compile` is `True` this is a `tf.function` compiled with
+          XLA, which is shared by all elements of the same configuration and relaxes
+          its input shapes, so neither a new element instance nor a new mesh
+          shape forces a retrace.
+    """
+    if not element.jit_compile:
+        return lambda values, element_nodes: kernel(values, element_nodes, element)
+
+    key = (kernel, element_config(element))
+    if key not in _compiled_kernels:
+        _compiled_kernels[key] = _compile_kernel(kernel, key[1])
+    return _compiled_kernels[key]
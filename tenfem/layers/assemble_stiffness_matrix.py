@@ -13,7 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """ Layer to assemble the stiffness matrix. """
-from typing import Callable
+from typing import Callable, Union
 import tensorflow as tf
 import tenfem
 from tenfem.layers import BaseFEMLayer
@@ -22,10 +22,16 @@ from tenfem.layers import BaseFEMLayer
 class AssembleStiffnessMatrix(BaseFEMLayer):
     """ tf.keras Layer for assembling the stiffness matrix. """
     def __init__(self,
-                 diffusion_coefficient: Callable,
+                 diffusion_coefficient: Union[Callable, float],
                  name: str = 'assemble_stiffness_matrix',
                  *args, **kwargs):
-        """ Create an AssembleStiffnessMatrix layer. """
+        """ Create an AssembleStiffnessMatrix layer.
+
+        Args:
+            diffusion_coefficient: Either a callable giving the diffusion coefficient
+              at the mesh quadrature nodes, or a python float or scalar `Tensor`
+              giving a constant diffusion coefficient.
+        """
         super(AssembleStiffnessMatrix, self).__init__(name=name, *args, **kwargs)
         self._diffusion_coefficient = diffusion_coefficient
 
@@ -39,17 +45,22 @@ class AssembleStiffnessMatrix(BaseFEMLayer):
                                                        self.reference_element)
         element = self.reference_element
 
-        # shape [mesh.n_elements, element_dim, spatial_dim]
-        mesh_quadrature_nodes = element.get_quadrature_nodes(mesh)
+        if callable(self.diffusion_coefficient):
+            # shape [mesh.n_elements, element_dim, spatial_dim]
+            mesh_quadrature_nodes = element.get_quadrature_nodes(mesh)
 
-        element_dim = tf.shape(mesh_quadrature_nodes)[-2]
-        spatial_dim = tf.shape(mesh.nodes)[-1]
+            element_dim = tf.shape(mesh_quadrature_nodes)[-2]
+            spatial_dim = tf.shape(mesh.nodes)[-1]
 
-        # evaluate the diffusion coefficient at the quadrature nodes
-        flat_mesh_quadrature_nodes = tf.reshape(mesh_quadrature_nodes, [-1, spatial_dim])
-        diffusion_coeff_vals = tf.reshape(
-            self.diffusion_coefficient(flat_mesh_quadrature_nodes),
-            [-1, mesh.n_elements, element_dim])
+            # evaluate the diffusion coefficient at the quadrature nodes
+            flat_mesh_quadrature_nodes = tf.reshape(mesh_quadrature_nodes, [-1, spatial_dim])
+            diffusion_coeff_vals = tf.reshape(
+                self.diffusion_coefficient(flat_mesh_quadrature_nodes),
+                [-1, mesh.n_elements, element_dim])
+        else:
+            # a constant coefficient is passed straight through as a scalar
+            element_dim = tf.shape(mesh.elements)[-1]
+            diffusion_coeff_vals = self.diffusion_coefficient
 
         local_stiffness_mat = tenfem.fem.assemble_local_stiffness_matrix(
             diffusion_coeff_vals, mesh, element)
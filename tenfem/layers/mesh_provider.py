@@ -12,11 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """ Layers to provide meshes. """
+import weakref
 import tensorflow as tf
 import tenfem
 from tenfem.layers import BaseFEMLayer
 
 
+# preconditioning matrices keyed by mesh, and then by the element configuration
+_precond_matrix_cache = weakref.WeakKeyDictionary()
+
+
+def _get_precond_matrix(mesh, reference_element):
+    """ Returns the stiffness matrix of a unit diffusion coefficient on `mesh`.
+
+    The matrix depends only on the mesh geometry and the element configuration so
+    it is assembled once and shared between every layer providing the mesh.
+    """
+    mesh_cache = _precond_matrix_cache.setdefault(mesh, {})
+    key = tenfem.fem.jit_utils.element_config(reference_element)
+    if key not in mesh_cache:
+        # assemble eagerly so the cached matrix can outlive any tf.function trace
+        with tf.init_scope():
+            mesh_cache[key] = tenfem.layers.AssembleStiffnessMatrix(
+                1., reference_element=reference_element)(mesh.get_tensor_repr())[0]
+    return mesh_cache[key]
+
+
 class MeshProvider(BaseFEMLayer):
     """ Layer to provide a mesh. """
     def __init__(self,
@@ -35,29 +56,40 @@ class MeshProvider(BaseFEMLayer):
         """
         super(MeshProvider, self).__init__(reference_element,
                                            name=name)
-        element_dim = tf.shape(mesh.elements)[-1]
-        # shape checking of elements
-        if element_dim != reference_element.element_dim:
+        # shape checking of elements as python integers, so that no ops are
+        # created and the check is safe to trace
+        element_dim = mesh.elements.shape[-1]
+        reference_element_dim = int(reference_element.element_dim)
+        if element_dim is not None and element_dim != reference_element_dim:
             raise ValueError(
-                ''.join(('mesh.elements is a Tensor of shape {}.'.format(tf.shape(mesh.elements)),
-                         'but reference_element.element_dim == {}'.format(reference_element.element_dim))))
+                'mesh.elements has element_dim={}, but reference_element.element_dim={}'.format(
+                    element_dim, reference_element_dim))
 
         self.mesh = mesh
-        self.padding_element = tf.constant(padding_element)
-        self.n_nodes = self.mesh.n_nodes
-        self.n_elements = self.mesh.n_elements
+        self.padding_element = tf.convert_to_tensor(padding_element)
+
+        # prefer python integers when the mesh shapes are statically known
+        n_nodes, n_elements = mesh.nodes.shape[-2], mesh.elements.shape[-2]
+        self.n_nodes = n_nodes if n_nodes is not None else self.mesh.n_nodes
+        self.n_elements = n_elements if n_elements is not None else self.mesh.n_elements
 
         self.return_precond_matrix = return_precond_matrix
-        if self.return_precond_matrix:
-            self._build_precond_matrix()
 
-    def _build_precond_matrix(self):
-        self.precond_matrix = tenfem.layers.AssembleStiffnessMatrix(
-           lambda x: tf.ones_like(x)[..., 0],
-           reference_element=self.reference_element)(self.mesh.get_tensor_repr())[0]
+        # the mesh is static so its tensor representation is formed once
+        self._mesh_tensor_repr = self.mesh.get_tensor_repr()
+
+    @property
+    def precond_matrix(self):
+        """ Stiffness matrix of a unit diffusion coefficient on the mesh. """
+        return _get_precond_matrix(self.mesh, self.reference_element)
+
+    def build(self, input_shape):
+        if self.return_precond_matrix:
+            _get_precond_matrix(self.mesh, self.reference_element)
+        super(MeshProvider, self).build(input_shape)
 
     def call(self, inputs):
-        mesh_tensor_repr = self.mesh.get_tensor_repr()
+        mesh_tensor_repr = self._mesh_tensor_repr
         if self.return_precond_matrix:
             return mesh_tensor_repr, self.precond_matrix
         else:
@@ -54,14 +54,19 @@ class BaseMesh(tf.Module):
             nodes,
             dtype=dtype,
         )
-        if dtype is not None:
-            self.cast_nodes(dtype)
 
         self._elements = tf.convert_to_tensor(
             elements,
             dtype=tf.int32
         )
 
+        # coordinates of the nodes of each element, gathered on first access
+        # and shared by everything assembled on this mesh
+        self._element_nodes = None
+
+        if dtype is not None:
+            self.cast_nodes(dtype)
+
         self._boundary_elements = tf.convert_to_tensor(
                 boundary_elements,
                 dtype=tf.int32
@@ -92,6 +97,19 @@ class BaseMesh(tf.Module):
         """ Elements of the mesh. """
         return self._elements
 
+    @property
+    def element_nodes(self):
+        """ Coordinates of the nodes of each element, a `Tensor` of shape
+        `[n_elements, element_dim, spatial_dimension]`. """
+        if self._element_nodes is None:
+            if hasattr(self._nodes, 'numpy'):
+                # gather eagerly so the memoised tensor can outlive any tf.function trace
+                with tf.init_scope():
+                    self._element_nodes = tf.gather(self._nodes, self._elements)
+            else:
+                self._element_nodes = tf.gather(self._nodes, self._elements)
+        return self._element_nodes
+
     @property
     def n_elements(self):
         return tf.shape(self.elements)[-2]
@@ -122,6 +140,7 @@ class BaseMesh(tf.Module):
     def cast_nodes(self, dtype):
         """ Cast the node tensors to a new dtype. """
         self._nodes = tf.cast(self._nodes, dtype)
+        self._element_nodes = None
 
     def get_tensor_repr(self) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor, tf.Tensor]:
         """ Returns a representation of the mesh as a Tensor
@@ -16,6 +16,7 @@ import tensorflow as tf
 import numpy as np
 import tenfem
 from tenfem.reference_elements import TriangleElement
+from tenfem.reference_elements.triangle import QUADRATIC_ELEMENT_ORIENTATION
 
 
 def mesh_from_tensor_repr(mesh_tensor_repr, mesh_element):
@@ -56,14 +57,7 @@ def orientate_triangle_elements(elements):
         # orientated
         return elements
     elif element_dim == 6:
-        elem = elements
-        elem = tf.concat((elem[..., 0, tf.newaxis],
-                          elem[..., 5, tf.newaxis],
-                          elem[..., 1, tf.newaxis],
-                          elem[..., 3, tf.newaxis],
-                          elem[..., 2, tf.newaxis],
-                          elem[..., 4, tf.newaxis]), axis=-1)
-        return elem
+        return tf.gather(elements, QUADRATIC_ELEMENT_ORIENTATION, axis=-1)
 
 
 # `boundary_elements` should be all those points on the boundary, w
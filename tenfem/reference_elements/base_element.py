@@ -24,15 +24,33 @@ __all__ = ['BaseReferenceElement', ]
 class BaseReferenceElement(tf.Module):
     """ Base class for reference elements. """
     def __init__(self,
-                 name: str = 'base_reference_element'):
+                 name: str = 'base_reference_element',
+                 jit_compile: bool = False):
         """ Create a BaseReferenceElement instance
 
         Args:
             name: A python string giving the name of the base element,
               Default: `base_reference_element`.
+            jit_compile: A python boolean, if `True` the local assembly
+              kernels on this element are XLA compiled. Default: `False`.
 
         """
         super(BaseReferenceElement, self).__init__(name=name)
+        self._jit_compile = jit_compile
+
+    @abc.abstractmethod
+    def get_config(self):
+        """ Constructor arguments, other than `jit_compile`, defining the element. """
+
+    @property
+    def degree(self):
+        """ Degree of the polynomials spanning the element. """
+        return self._degree
+
+    @property
+    def jit_compile(self):
+        """ Whether the local assembly kernels on this element are XLA compiled. """
+        return self._jit_compile
 
     @property
     def element_dim(self):
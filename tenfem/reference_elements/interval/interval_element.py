@@ -29,7 +29,8 @@ class IntervalElement(BaseReferenceElement):
     def __init__(self,
                  degree: int,
                  quadrature_order: int = 2,
-                 dtype: tf.DType = tf.float32):
+                 dtype: tf.DType = tf.float32,
+                 jit_compile: bool = False):
         """ Creates in IntervalElement instance.
 
         Args:
@@ -39,12 +40,15 @@ class IntervalElement(BaseReferenceElement):
               quadrature of integrals over this element.
             dtype: (optional) A `tf.DType` giving the data-type of the mesh nodes.
               Default, None then dtype defaults to `tf.float32`.
+            jit_compile: (optional) A python boolean, if `True` the local assembly
+              kernels on this element are XLA compiled. Default, `False`.
 
         Raises:
             NotImplementedError: If `degree` is not in [1, ]. Only linear
               shape functions currently implemented.
         """
-        super(IntervalElement, self).__init__(name='interval_element')
+        super(IntervalElement, self).__init__(name='interval_element',
+                                              jit_compile=jit_compile)
         self._degree = degree
         self._dtype = dtype
         self._quadrature_order = quadrature_order
@@ -57,6 +61,17 @@ class IntervalElement(BaseReferenceElement):
                 'Currently only linear shape functions',
                 'supported on IntervalElements')))
 
+    def get_config(self):
+        """ Constructor arguments, other than `jit_compile`, defining the element. """
+        return {'degree': self.degree,
+                'quadrature_order': self.quadrature_order,
+                'dtype': self.dtype}
+
+    @property
+    def half_weights(self):
+        """ Quadrature weights scaled to the unit length reference interval. """
+        return 0.5 * self.get_quadrature_nodes_and_weights()[0]
+
     def get_quadrature_nodes(self, mesh: BaseMesh) -> tf.Tensor:
         """ Alias into get_mesh_quadrature_nodes for compatability with layers. """
         return self.get_mesh_quadrature_nodes(mesh)[0]
@@ -78,10 +93,8 @@ class IntervalElement(BaseReferenceElement):
         shape_fn = self.shape_function
         weights, quad_nodes = self.get_quadrature_nodes_and_weights()
 
-        element_nodes = tf.gather(mesh.nodes, mesh.elements)
         shape_fn_vals, _ = shape_fn(quad_nodes[:, 0])
-        return tf.reduce_sum(element_nodes[..., tf.newaxis, :, :]
-                             * shape_fn_vals[..., tf.newaxis], axis=-2), weights
+        return tf.einsum('...ic,qi->...qc', mesh.element_nodes, shape_fn_vals), weights
 
     def get_quadrature_nodes_and_weights(self):
         """ The nodes and weights for Gaussian quadrature on an interval element.
@@ -108,7 +121,7 @@ class IntervalElement(BaseReferenceElement):
               `mesh.n_elements`.
         """
         if isinstance(mesh, IntervalMesh):
-            nodes = tf.gather(mesh.nodes, mesh.elements)
+            nodes = mesh.element_nodes
             volumes = tf.abs(nodes[..., 1, 0] - nodes[..., 0, 0])
             return volumes
         else:
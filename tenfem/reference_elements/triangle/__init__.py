@@ -12,5 +12,5 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ============================================================================
-from .triangle_element import TriangleElement
+from .triangle_element import TriangleElement, QUADRATIC_ELEMENT_ORIENTATION
 from .gaussian_quadrature import gauss_quad_nodes_and_weights
\ No newline at end of file
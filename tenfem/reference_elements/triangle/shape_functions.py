@@ -36,7 +36,7 @@ def p1_shape_fn(r, s):
     dsdr = tf.concat([-tf.ones_like(s0), tf.ones_like(s1), tf.zeros_like(s2)], axis=-1)
     dsds = tf.concat([-tf.ones_like(s0), tf.zeros_like(s1), tf.ones_like(s2)], axis=-1)
 
-    return shape_fn, tf.concat((dsdr[tf.newaxis, ...], dsds[tf.newaxis, ...]), axis=0)
+    return shape_fn, tf.stack((dsdr, dsds), axis=0)
 
 
 def p2_shape_fn(r, s):
@@ -65,4 +65,4 @@ def p2_shape_fn(r, s):
     dsds = tf.concat([-3 + 4 * r + 4 * s, tf.zeros_like(r), 4 * s - 1, 4 * r, 4 - 4 * r - 8 * s, -4 * r], axis=-1)
 
     shape_fn = tf.concat((s0, s1, s2, s3, s4, s5), axis=-1)
-    return shape_fn, tf.concat((dsdr[tf.newaxis, ...], dsds[tf.newaxis, ...]), axis=0)
+    return shape_fn, tf.stack((dsdr, dsds), axis=0)
@@ -17,10 +17,19 @@ from tenfem.reference_elements import BaseReferenceElement
 from .shape_functions import p1_shape_fn, p2_shape_fn
 from .gaussian_quadrature import gauss_quad_nodes_and_weights
 
+# reordering of the quadratic element nodes giving a closed path around
+# the boundary of the element
+QUADRATIC_ELEMENT_ORIENTATION = (0, 5, 1, 3, 2, 4)
+
 
 class TriangleElement(BaseReferenceElement):
     """ Reference element for a triangle mesh. """
-    def __init__(self, degree: int, dtype: tf.DType = tf.float32):
+
+    def __init__(self,
+                 degree: int,
+                 dtype: tf.DType = tf.float32,
+                 compute_dtype: tf.DType = None,
+                 jit_compile: bool = False):
         """
 
         Args:
@@ -28,14 +37,25 @@ class TriangleElement(BaseReferenceElement):
               function space.
             dtype: (optional) A `tf.DType` giving the data-type of the mesh nodes.
               Default, None then dtype defaults to `tf.float32`.
+            compute_dtype: (optional) A `tf.DType` giving the data-type used for
+              the contractions with the shape function gradients in `isomap`,
+              for example `tf.bfloat16`. These contractions also accumulate in
+              `compute_dtype`, there is no separate higher precision accumulator,
+              and their results are cast back to `dtype`. The jacobian determinant
+              and inverse are always formed in `dtype`.
+              Default, None then compute_dtype defaults to `dtype`.
+            jit_compile: (optional) A python boolean, if `True` the local assembly
+              kernels on this element are XLA compiled. Default, `False`.
 
         Raises:
             NotImplementedError: If `degree` is not in [1, 2]. Only linear and
               quadratic shape functions currently implemented.
         """
-        super(TriangleElement, self).__init__(name='triangle_element')
+        super(TriangleElement, self).__init__(name='triangle_element',
+                                              jit_compile=jit_compile)
         self._degree = degree
         self._dtype = dtype
+        self._compute_dtype = dtype if compute_dtype is None else compute_dtype
 
         # Todo: Investigate why the `get_quadrature_nodes` function
         #  breaks when quadrature order is a tensor -- something to
@@ -53,6 +73,24 @@ class TriangleElement(BaseReferenceElement):
                 ('Only degree p in [1, 2] polynomials currently supported',
                  'for TriangleElement')))
 
+        # the map from the reference element to a linear triangle is affine
+        # so the jacobian is constant over each element
+        self._const_jacobian = self.degree == 1
+
+        # the quadrature rule and the shape functions evaluated at its nodes are
+        # fixed by the degree of the element so are computed once and reused
+        self._quad_weights, self._quad_nodes = gauss_quad_nodes_and_weights(
+            self.quadrature_order, dtype=self.dtype)
+        self._half_weights = 0.5 * self._quad_weights
+        self._quad_shape_fn_vals, self._quad_shape_fn_grad = self._shape_fn(
+            self._quad_nodes[..., 0], self._quad_nodes[..., 1])
+
+    def get_config(self):
+        """ Constructor arguments, other than `jit_compile`, defining the element. """
+        return {'degree': self.degree,
+                'dtype': self.dtype,
+                'compute_dtype': self.compute_dtype}
+
     @property
     def degree(self):
         return self._degree
@@ -67,6 +105,17 @@ class TriangleElement(BaseReferenceElement):
         """ Data-type of the element. """
         return self._dtype
 
+    @property
+    def compute_dtype(self):
+        """ Data-type of the contractions, including their accumulation, carried
+        out in `isomap`. """
+        return self._compute_dtype
+
+    @property
+    def half_weights(self):
+        """ Quadrature weights scaled by the area, 1/2, of the reference triangle. """
+        return self._half_weights
+
     def get_quadrature_nodes(self, mesh):
         """ Get the gaussian quadrature nodes of the mesh.
 
@@ -80,13 +129,7 @@ class TriangleElement(BaseReferenceElement):
               giving the coordinates of the quadrature nodes on the mesh.
 
         """
-        shape_fn = self.shape_function
-        _, quad_nodes = gauss_quad_nodes_and_weights(self.quadrature_order, dtype=self.dtype)
-
-        element_nodes = tf.gather(mesh.nodes, mesh.elements)
-        shape_fn_vals, shape_fn_grads = shape_fn(quad_nodes[..., 0], quad_nodes[..., 1])
-        return tf.reduce_sum(element_nodes[..., tf.newaxis, :, :]
-                             * shape_fn_vals[..., tf.newaxis], axis=-2)
+        return tf.einsum('...ic,qi->...qc', mesh.element_nodes, self._quad_shape_fn_vals)
 
     def get_quadrature_nodes_and_weights(self):
         """ The nodes and weights for Gaussian quadrature on a triangle element.
@@ -98,21 +141,18 @@ class TriangleElement(BaseReferenceElement):
             nodes: A float `Tensor` giving the nodes of the Gaussian
               quadrature rule of shape [len(weights), 2], with data-type
               equal to `dtype`.
-
-        Raises:
-            NotImplementedError: If order is not in [1, 2, 3, 4].
         """
-        return gauss_quad_nodes_and_weights(self.quadrature_order, self.dtype)
+        return self._quad_weights, self._quad_nodes
 
     def isomap(self, nodes, canonical_coordinates):
         """ Transform from canonical coordinates to the elements given by nodes.
 
-        ToDo: Add tests to isomap
-
         Args:
             nodes: A batched tensor of shape [..., element_dim, 2]
             canonical_coordinates: A tensor of shape [n, 2] where n is the number of
-              points in the reference element to evalaute.
+              points in the reference element to evalaute. If these are the
+              quadrature nodes returned by `get_quadrature_nodes_and_weights`
+              then the cached shape function values at these nodes are used.
 
         Returns:
             shape_fn_vals: The values of the shape functions at the canonical coordinates. This
@@ -127,27 +167,64 @@ class TriangleElement(BaseReferenceElement):
               the jacobian determinant of the coordinate transform at each
               canonical coordinate.
         """
-        r = canonical_coordinates[..., 0]
-        s = canonical_coordinates[..., 1]
-        shape_fn_vals, shape_fn_grad = self.shape_function(r, s)
+        if canonical_coordinates is self._quad_nodes:
+            shape_fn_vals = self._quad_shape_fn_vals
+            shape_fn_grad = self._quad_shape_fn_grad
+        else:
+            r = canonical_coordinates[..., 0]
+            s = canonical_coordinates[..., 1]
+            shape_fn_vals, shape_fn_grad = self.shape_function(r, s)
 
-        x = nodes[..., 0][..., tf.newaxis, :]
-        y = nodes[..., 1][..., tf.newaxis, :]
+        mixed_precision = self.compute_dtype != self.dtype
 
-        j11 = tf.reduce_sum(shape_fn_grad[0] * x, axis=-1)
-        j12 = tf.reduce_sum(shape_fn_grad[0] * y, axis=-1)
-        j21 = tf.reduce_sum(shape_fn_grad[1] * x, axis=-1)
-        j22 = tf.reduce_sum(shape_fn_grad[1] * y, axis=-1)
+        def _maybe_cast(x, dtype):
+            # casts are only inserted for mixed precision so that inputs of the
+            # wrong dtype still raise
+            return tf.cast(x, dtype) if mixed_precision else x
 
-        jacobian_det = j11 * j22 - j12 * j21
+        if mixed_precision:
+            # nodes must still match the element dtype before the downcast
+            nodes = tf.convert_to_tensor(nodes, dtype=self.dtype)
+
+        compute_shape_fn_grad = _maybe_cast(shape_fn_grad, self.compute_dtype)
 
-        dSdx = (j22[..., tf.newaxis] * shape_fn_grad[0]
-                - j12[..., tf.newaxis] * shape_fn_grad[1]) / jacobian_det[..., tf.newaxis]
-        dSdy = (-j21[..., tf.newaxis] * shape_fn_grad[0]
-                + j11[..., tf.newaxis] * shape_fn_grad[1]) / jacobian_det[..., tf.newaxis]
+        if self._const_jacobian:
+            # the jacobian only needs to be formed at a single canonical coordinate
+            jacobian_shape_fn_grad = compute_shape_fn_grad[:, :1, :]
+        else:
+            jacobian_shape_fn_grad = compute_shape_fn_grad
+
+        # jacobian of shape [..., 2, n_jacobian_coords, 2] formed in a single
+        # contraction over the element nodes
+        jacobian = tf.einsum('dqi,...ic->...dqc',
+                             jacobian_shape_fn_grad, _maybe_cast(nodes, self.compute_dtype))
+        jacobian = _maybe_cast(jacobian, self.dtype)
+
+        j11 = jacobian[..., 0, :, 0]
+        j12 = jacobian[..., 0, :, 1]
+        j21 = jacobian[..., 1, :, 0]
+        j22 = jacobian[..., 1, :, 1]
 
-        pushfwd_shape_fn_grad = tf.concat((dSdx[tf.newaxis, ...],
-                                           dSdy[tf.newaxis, ...]), axis=0)
+        jacobian_det = j11 * j22 - j12 * j21
+        inv_det = tf.math.reciprocal(jacobian_det)
+
+        # analytic inverse of the 2x2 jacobian, shape [..., 2, n_jacobian_coords, 2]
+        jacobian_inv = tf.stack((tf.stack((j22 * inv_det, -j12 * inv_det), axis=-1),
+                                 tf.stack((-j21 * inv_det, j11 * inv_det), axis=-1)), axis=-3)
+        jacobian_inv = _maybe_cast(jacobian_inv, self.compute_dtype)
+
+        if self._const_jacobian:
+            # broadcast the per element jacobian over the canonical coordinates
+            pushfwd_shape_fn_grad = tf.einsum('...de,eqi->d...qi',
+                                              jacobian_inv[..., 0, :],
+                                              compute_shape_fn_grad)
+            n = tf.shape(shape_fn_grad)[-2]  # number of canonical coords.
+            jacobian_det = jacobian_det * tf.ones([n], dtype=self.dtype)
+        else:
+            pushfwd_shape_fn_grad = tf.einsum('...dqe,eqi->d...qi',
+                                              jacobian_inv,
+                                              compute_shape_fn_grad)
+        pushfwd_shape_fn_grad = _maybe_cast(pushfwd_shape_fn_grad, self.dtype)
 
         return shape_fn_vals, pushfwd_shape_fn_grad, jacobian_det
 
@@ -169,13 +246,6 @@ class TriangleElement(BaseReferenceElement):
             # orientated
             return mesh.elements
         elif self.element_dim == 6:
-            elem = mesh.elements
-            elem = tf.concat((elem[..., 0, tf.newaxis],
-                              elem[..., 5, tf.newaxis],
-                              elem[..., 1, tf.newaxis],
-                              elem[..., 3, tf.newaxis],
-                              elem[..., 2, tf.newaxis],
-                              elem[..., 4, tf.newaxis]), axis=-1)
-            return elem
+            return tf.gather(mesh.elements, QUADRATIC_ELEMENT_ORIENTATION, axis=-1)
         else:
             raise NotImplementedError("Only linear and quadratic elements currently implemented.")
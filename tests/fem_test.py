@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """ Tests for fem module """
+import weakref
 from absl.testing import absltest
 
 import tenfem
@@ -47,6 +48,45 @@ class AssembleLocalStiffnessMatrixTest(absltest.TestCase):
         global_stiffness_mat = tenfem.fem.scatter_matrix_to_global(
             local_stiffness_mat, elements, mesh.n_nodes)
 
+    def test_constant_diffusion_coefficient(self):
+        mesh = tenfem.mesh.examples.square(3, 3)
+        element_dim = tf.shape(mesh.elements)[-1]
+        diff_coeff = 2. * tf.ones([mesh.n_elements, element_dim])
+
+        local_stiffness_mat = tenfem.fem.assemble_local_stiffness_matrix(
+            diff_coeff, mesh, element)
+        const_local_stiffness_mat = tenfem.fem.assemble_local_stiffness_matrix(
+            2., mesh, element)
+
+        np.testing.assert_allclose(const_local_stiffness_mat, local_stiffness_mat, rtol=1e-6)
+
+    def test_jit_compiled_stiffness_matrix(self):
+        compiled_kernels = tenfem.fem.jit_utils._compiled_kernels
+        n_compiled_kernels = len(compiled_kernels)
+
+        jit_element_refs = []
+        for n in [3, 4, 5]:
+            mesh = tenfem.mesh.examples.square(n, n)
+            jit_element = tenfem.reference_elements.TriangleElement(degree=1, jit_compile=True)
+            jit_element_refs.append(weakref.ref(jit_element))
+            diff_coeff = tf.ones([mesh.n_elements, 3])
+
+            np.testing.assert_allclose(
+                tenfem.fem.assemble_local_stiffness_matrix(diff_coeff, mesh, jit_element),
+                tenfem.fem.assemble_local_stiffness_matrix(diff_coeff, mesh, element),
+                rtol=1e-5, atol=1e-6)
+
+        # fresh elements of the same configuration share one compiled kernel
+        self.assertLen(compiled_kernels, n_compiled_kernels + 1)
+
+        # relaxed shapes mean new meshes stop triggering retraces
+        kernel = list(compiled_kernels.values())[-1]
+        self.assertLessEqual(kernel.experimental_get_tracing_count(), 2)
+
+        # the compiled kernel does not keep the user's elements alive
+        del jit_element
+        self.assertEqual([ref() for ref in jit_element_refs], [None] * 3)
+
     def test_interval_stiffness_matrix(self):
         n_nodes = 5
         nodes = np.linspace(-0.5, 1.3, n_nodes)[..., np.newaxis]
@@ -169,6 +209,42 @@ class LinearEllipticOperatorTest(absltest.TestCase):
         self.assertRaises(ValueError, build_op_to_fail)
 
 
+class MeshProviderTest(absltest.TestCase):
+    def test_mesh_provider_element_dim(self):
+        mesh = tenfem.mesh.examples.square(4, 4)
+        p2_element = tenfem.reference_elements.TriangleElement(degree=2)
+
+        self.assertRaises(ValueError,
+                          lambda: tenfem.layers.MeshProvider(mesh, p2_element))
+
+        mesh_provider = tenfem.layers.MeshProvider(mesh, element)
+        self.assertEqual(mesh_provider.n_nodes, 16)
+        self.assertEqual(mesh_provider.n_elements, 18)
+
+    def test_mesh_provider_precond_matrix(self):
+        mesh = tenfem.mesh.examples.square(4, 4)
+        mesh_provider = tenfem.layers.MeshProvider(
+            mesh, element, return_precond_matrix=True)
+
+        @tf.function
+        def provide_mesh():
+            return mesh_provider(None)
+
+        _, precond_matrix = provide_mesh()
+        self.assertEqual(precond_matrix.shape, [mesh.n_nodes, mesh.n_nodes])
+
+        # the preconditioner is shared by all providers of the same mesh
+        other_provider = tenfem.layers.MeshProvider(
+            mesh, element, return_precond_matrix=True)
+        self.assertIs(other_provider.precond_matrix, mesh_provider.precond_matrix)
+
+        # but not with providers of a different element configuration
+        bf16_provider = tenfem.layers.MeshProvider(
+            mesh, tenfem.reference_elements.TriangleElement(degree=1, compute_dtype=tf.bfloat16),
+            return_precond_matrix=True)
+        self.assertIsNot(bf16_provider.precond_matrix, mesh_provider.precond_matrix)
+
+
 if __name__ == '__main__':
     absltest.main()
 
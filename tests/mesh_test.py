@@ -31,8 +31,16 @@ class BaseMeshTest(absltest.TestCase):
 
         mesh = tenfem.mesh.BaseMesh(nodes, elems, bnd_elems)
         self.assertEqual(mesh.dtype, np.float64)
+        self.assertEqual(mesh.element_nodes.dtype, np.float64)
         mesh.cast_nodes(tf.float32)
         self.assertEqual(mesh.dtype, np.float32)
+        self.assertEqual(mesh.element_nodes.dtype, np.float32)
+        np.testing.assert_allclose(mesh.element_nodes, nodes[elems])
+
+        # element nodes first gathered inside a trace remain usable eagerly
+        mesh = tenfem.mesh.BaseMesh(nodes, elems, bnd_elems)
+        tf.function(lambda: mesh.element_nodes)()
+        np.testing.assert_allclose(mesh.element_nodes, nodes[elems])
 
         bnd_node_inds = mesh.boundary_node_indices.numpy()
         self.assertEmpty(np.setdiff1d(bnd_node_inds, [0, 1, 2, 3]))
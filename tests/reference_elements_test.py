@@ -58,6 +58,51 @@ class TriangleElementTest(absltest.TestCase):
         quad_nodes = element.get_quadrature_nodes(mesh)
         np.testing.assert_allclose(tf.shape(quad_nodes), [mesh.n_elements, 3, 2])
 
+    def test_isomap(self):
+        element = tenfem.reference_elements.TriangleElement(degree=1)
+        # the affine map (r, s) -> (2r + s, 3s) of the reference triangle
+        nodes = tf.constant([[[0., 0.], [2., 0.], [1., 3.]]])
+        _, quad_nodes = element.get_quadrature_nodes_and_weights()
+
+        _, pf_shape_fn_grad, jac_det = element.isomap(nodes, quad_nodes)
+        np.testing.assert_allclose(jac_det, 6. * np.ones([1, 3]))
+
+        # gradients of the linear shape functions on the physical triangle
+        expected_grad = np.array([[-0.5, 0.5, 0.],
+                                  [-1. / 6, -1. / 6, 1. / 3]])
+        np.testing.assert_allclose(
+            pf_shape_fn_grad,
+            np.broadcast_to(expected_grad[:, None, None, :], [2, 1, 3, 3]),
+            rtol=1e-6, atol=1e-6)
+
+    def test_isomap_dtype_mismatch(self):
+        mesh = tenfem.mesh.examples.square(3, 3)
+        float64_nodes = tf.cast(mesh.element_nodes, tf.float64)
+        for compute_dtype in [None, tf.bfloat16]:
+            element = tenfem.reference_elements.TriangleElement(
+                degree=1, compute_dtype=compute_dtype)
+            _, quad_nodes = element.get_quadrature_nodes_and_weights()
+            with self.assertRaises((tf.errors.InvalidArgumentError, ValueError)):
+                element.isomap(float64_nodes, quad_nodes)
+
+    def test_isomap_compute_dtype(self):
+        element = tenfem.reference_elements.TriangleElement(degree=2)
+        bf16_element = tenfem.reference_elements.TriangleElement(
+            degree=2, compute_dtype=tf.bfloat16)
+        self.assertEqual(bf16_element.dtype, np.float32)
+        self.assertEqual(bf16_element.compute_dtype, tf.bfloat16)
+
+        mesh = tenfem.mesh.triangle.convert_linear_to_quadratic(
+            tenfem.mesh.examples.square(3, 3))
+        _, quad_nodes = element.get_quadrature_nodes_and_weights()
+        _, pf_grad, jac_det = element.isomap(mesh.element_nodes, quad_nodes)
+        _, bf16_pf_grad, bf16_jac_det = bf16_element.isomap(mesh.element_nodes, quad_nodes)
+
+        self.assertEqual(bf16_pf_grad.dtype, np.float32)
+        np.testing.assert_allclose(bf16_jac_det, jac_det, rtol=5e-2)
+        np.testing.assert_allclose(bf16_pf_grad, pf_grad, rtol=5e-2,
+                                   atol=2e-2 * np.max(np.abs(pf_grad)))
+
 
 if __name__ == '__main__':
     absltest.main()